@@ -20,9 +20,6 @@ src_path = Path(__file__).parent / "src"
 if src_path.exists():
     sys.path.insert(0, str(src_path))
 
-from supakeeper.config import Config
-from supakeeper.scheduler import create_scheduler
-
 
 def main() -> int:
     """Main entry point."""
@@ -66,6 +63,10 @@ Configuration:
         print(f"Supakeeper v{__version__}")
         return 0
     
+    # Imported here so that --version does not load the Supabase SDK
+    from supakeeper.config import Config
+    from supakeeper.scheduler import create_scheduler, use_uvloop
+    
     try:
         config = Config.load()
         
@@ -77,6 +78,7 @@ Configuration:
             print("See env.example for configuration examples.")
             return 1
         
+        use_uvloop()
         scheduler = create_scheduler(config)
         
         if args.daemon:
@@ -10,12 +10,11 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from supakeeper import __version__
 from supakeeper.config import Config
 from supakeeper.keeper import SupaKeeper
-from supakeeper.scheduler import create_scheduler
+from supakeeper.scheduler import create_scheduler, use_uvloop
 
 app = typer.Typer(
     name="supakeeper",
@@ -87,6 +86,7 @@ def run(
             console.print("See env.example for configuration examples.")
             raise typer.Exit(1)
         
+        use_uvloop()
         scheduler = create_scheduler(cfg)
         
         if once:
@@ -106,10 +106,12 @@ def run(
 @app.command()
 def status() -> None:
     """Show status of configured Supabase projects."""
+    from rich.table import Table
+    
     try:
         cfg = Config.load()
-        keeper = SupaKeeper(cfg)
-        status_info = keeper.get_status()
+        with SupaKeeper(cfg) as keeper:
+            status_info = keeper.get_status()
         
         console.print()
         console.print("[bold cyan]Supakeeper Status[/]")
@@ -174,13 +176,11 @@ def ping(
                 raise typer.Exit(1)
             cfg.projects = matching
         
-        keeper = SupaKeeper(cfg)
-        results = keeper.ping_all()
-        
-        success = sum(1 for r in results if r.success)
-        failed = len(results) - success
+        use_uvloop()
+        with SupaKeeper(cfg) as keeper:
+            keeper.ping_all()
         
-        if failed > 0:
+        if keeper.last_failed_count > 0:
             raise typer.Exit(1)
             
     except Exception as e:
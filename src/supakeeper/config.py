@@ -7,14 +7,42 @@ Loads configuration from environment variables (.env file supported).
 from __future__ import annotations
 
 import os
-import re
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
+# Prefix of numbered project variables (SUPABASE_URL_1, SUPABASE_URL_2, etc.)
+_PROJECT_URL_PREFIX = "SUPABASE_URL_"
 
-@dataclass
+
+@lru_cache(maxsize=4)
+def _read_dotenv(path: str, mtime: float) -> dict[str, Optional[str]]:
+    """Parse a .env file. Cached until the file's modification time changes."""
+    return dotenv_values(path)
+
+
+def _load_dotenv() -> None:
+    """Apply the .env file to the environment without overriding existing values."""
+    path = find_dotenv()
+    if not path:
+        return
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return
+    for key, value in _read_dotenv(path, mtime).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
+# Fields that the precomputed ping request depends on
+_PING_FIELDS = frozenset({"url", "key", "table"})
+
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Configuration for a single Supabase project."""
     
@@ -23,6 +51,9 @@ class ProjectConfig:
     key: str
     table: Optional[str] = None
     enabled: bool = True
+    # Keep-alive REST request, derived from url/key/table
+    ping_url: str = field(init=False, repr=False, compare=False)
+    ping_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
         """Validate project configuration."""
@@ -32,9 +63,43 @@ class ProjectConfig:
             raise ValueError(f"Project '{self.name}': API key is required")
         if not self.url.startswith("https://"):
             raise ValueError(f"Project '{self.name}': URL must start with https://")
+        self._build_ping_request()
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        # Before construction is done there is nothing to re-validate yet
+        if name not in _PING_FIELDS or not hasattr(self, "ping_url"):
+            object.__setattr__(self, name, value)
+            return
+        # Re-validate and rebuild the ping request, putting the old value
+        # back if the new one is rejected
+        old_value = getattr(self, name)
+        object.__setattr__(self, name, value)
+        try:
+            self.__post_init__()
+        except ValueError:
+            object.__setattr__(self, name, old_value)
+            raise
+    
+    def __reduce__(self):
+        # Copy and pickle through the constructor, which rebuilds the derived
+        # ping request (a read-only mapping can't be pickled)
+        return (type(self), (self.name, self.url, self.key, self.table, self.enabled))
+    
+    def _build_ping_request(self) -> None:
+        """Precompute the PostgREST URL and headers used for keep-alive pings."""
+        base_url = f"{self.url.rstrip('/')}/rest/v1/"
+        if self.table:
+            self.ping_url = f"{base_url}{self.table}?select=*&limit=1"
+        else:
+            self.ping_url = base_url
+        # Read-only, since the same mapping is shared by every ping
+        self.ping_headers = MappingProxyType({
+            "apikey": self.key,
+            "Authorization": f"Bearer {self.key}",
+        })
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration for Supakeeper."""
     
@@ -54,13 +119,14 @@ class Config:
         """
         Load configuration from environment variables.
         
-        Supports .env file via python-dotenv.
+        Supports .env file via python-dotenv. The parsed file is cached
+        and only re-read when its modification time changes.
             
         Returns:
             Config instance with loaded settings
         """
         # Load .env file if exists
-        load_dotenv()
+        _load_dotenv()
         
         projects = []
         
@@ -77,17 +143,16 @@ class Config:
             ))
         
         # Check for numbered project configurations (SUPABASE_URL_1, SUPABASE_URL_2, etc.)
-        env_pattern = re.compile(r"SUPABASE_URL_(\d+)")
-        project_indices = set()
+        project_urls: dict[str, str] = {}
+        prefix_len = len(_PROJECT_URL_PREFIX)
         
-        for key in os.environ:
-            match = env_pattern.match(key)
-            if match:
-                project_indices.add(match.group(1))
+        for key, value in os.environ.items():
+            if key.startswith(_PROJECT_URL_PREFIX) and key[prefix_len:].isdecimal():
+                project_urls[key[prefix_len:]] = value
         
         # Sort indices numerically
-        for idx in sorted(project_indices, key=int):
-            url = os.getenv(f"SUPABASE_URL_{idx}")
+        for idx in sorted(project_urls, key=int):
+            url = project_urls[idx]
             api_key = os.getenv(f"SUPABASE_KEY_{idx}")
             
             if url and api_key:
@@ -115,6 +180,22 @@ class Config:
         """Get list of enabled projects."""
         return [p for p in self.projects if p.enabled]
     
+    def get_project(self, name: str) -> Optional[ProjectConfig]:
+        """
+        Find a project by name (case-insensitive).
+        
+        Args:
+            name: Project name to look up
+            
+        Returns:
+            The first project with that name, or None if not found
+        """
+        name = name.lower()
+        for project in self.projects:
+            if project.name.lower() == name:
+                return project
+        return None
+    
     def validate(self) -> list[str]:
         """
         Validate configuration and return list of errors.
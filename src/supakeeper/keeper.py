@@ -7,20 +7,51 @@ being paused due to inactivity.
 
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
-from supabase import create_client, Client
+import httpx
 
 from supakeeper.config import Config, ProjectConfig
 from supakeeper.logger import get_logger, setup_logger
 from supakeeper.notifier import Notifier
 
+if TYPE_CHECKING:
+    from supabase import Client
 
-@dataclass
+# Supabase clients shared by all keepers in the process, keyed by (url, key)
+_CLIENT_CACHE: dict[tuple[str, str], Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# A ping strategy returns a success message, or None if it did not work for the project
+PingStrategy = Callable[[ProjectConfig], Awaitable[Optional[str]]]
+
+# Wall clock used to stamp ping results
+_clock_ns = time.time_ns
+
+
+def create_client(supabase_url: str, supabase_key: str) -> Client:
+    """Create a Supabase client, importing the SDK only when first needed."""
+    from supabase import create_client as _create_client
+    
+    return _create_client(supabase_url, supabase_key)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, running tasks eagerly where supported."""
+    loop = asyncio.new_event_loop()
+    # Python 3.12+: coroutines that finish without suspending skip the scheduler
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+@dataclass(slots=True)
 class PingResult:
     """Result of a keep-alive ping operation."""
     
@@ -28,11 +59,16 @@ class PingResult:
     success: bool
     message: str
     response_time_ms: Optional[float] = None
-    timestamp: datetime = None
+    timestamp_ns: int = 0
     
     def __post_init__(self) -> None:
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        if not self.timestamp_ns:
+            self.timestamp_ns = _clock_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the result was recorded."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
 class SupaKeeper:
@@ -46,6 +82,12 @@ class SupaKeeper:
     # Default table for health checks (Supabase auth.users is always available)
     AUTH_USERS_TABLE = "users"  # In auth schema
     
+    # Upper bound for the backoff delay between retries (seconds)
+    MAX_RETRY_DELAY = 300
+    
+    # Connection pool limits for the shared HTTP client
+    HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    
     def __init__(self, config: Optional[Config] = None) -> None:
         """
         Initialize SupaKeeper.
@@ -69,21 +111,158 @@ class SupaKeeper:
             telegram_bot_token=self.config.telegram_bot_token,
             telegram_chat_id=self.config.telegram_chat_id,
         ) if has_notifications else None
-        self._clients: dict[str, Client] = {}
+        # Shared HTTP client so keep-alive connections are reused across pings
+        self._http = httpx.AsyncClient(timeout=30.0, http2=True, limits=self.HTTP_LIMITS)
+        # SDK fallbacks in default order, tried only when the direct REST ping fails
+        self._fallbacks: list[PingStrategy] = [
+            self._ping_auth_admin,
+            self._ping_auth_session,
+        ]
+        # Outcome counts of the most recent ping_all, tallied while logging
+        self.last_success_count = 0
+        self.last_failed_count = 0
+        # Index of the SDK fallback that last succeeded, per project
+        self._strategy_cache: dict[str, int] = {}
+        # Event loop backing the synchronous API, created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def run(self, coro):
+        """
+        Run a coroutine to completion on the keeper's event loop.
+        
+        The loop is created on first use and owns the keeper's pooled HTTP
+        client, so blocking callers should drive keeper coroutines through it.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None:
+            self._loop = _new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    async def aclose(self) -> None:
+        """Release network resources held by this keeper."""
+        await self._http.aclose()
+        if self.notifier:
+            await asyncio.to_thread(self.notifier.close)
+    
+    def close(self) -> None:
+        """Release network resources and the keeper's event loop."""
+        if self._loop is not None:
+            self._loop.run_until_complete(self._http.aclose())
+            self._loop.close()
+            self._loop = None
+        if self.notifier:
+            self.notifier.close()
+    
+    def __enter__(self) -> "SupaKeeper":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "SupaKeeper":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
     def _get_client(self, project: ProjectConfig) -> Client:
-        """Get or create Supabase client for a project."""
-        if project.name not in self._clients:
-            self._clients[project.name] = create_client(project.url, project.key)
-        return self._clients[project.name]
+        """Get or create the process-wide Supabase client for a project."""
+        cache_key = (project.url, project.key)
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(cache_key)
+                if client is None:
+                    client = create_client(project.url, project.key)
+                    _CLIENT_CACHE[cache_key] = client
+        return client
+    
+    async def _ping_rest(self, project: ProjectConfig) -> Optional[str]:
+        """
+        Strategy 1: Direct REST API request via PostgREST.
+        
+        Queries the configured table if any, otherwise the root endpoint
+        which always responds. This is a single GET on the shared HTTP
+        client and does not need the Supabase SDK.
+        """
+        try:
+            response = await self._http.get(project.ping_url, headers=project.ping_headers)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Error reaching REST API: {e}", project=project.name)
+            return None
+        
+        if project.table and response.is_success:
+            return f"Successfully queried table '{project.table}'"
+        if not project.table and response.status_code in (200, 401, 403):
+            # Any of these responses means the project is active
+            return f"Successfully pinged REST API (status: {response.status_code})"
+        
+        self.logger.debug(
+            f"REST API returned status {response.status_code}", project=project.name
+        )
+        return None
+    
+    async def _ping_auth_admin(self, project: ProjectConfig) -> Optional[str]:
+        """Strategy 2 (SDK fallback): Query auth.users table (always exists in Supabase)."""
+        # Everything touching the SDK, including its first (heavy) import and
+        # client creation, runs in a worker thread
+        return await asyncio.to_thread(self._query_auth_users, project)
+    
+    async def _ping_auth_session(self, project: ProjectConfig) -> Optional[str]:
+        """Strategy 3 (SDK fallback): Check the stored auth session, refreshing it if expired."""
+        return await asyncio.to_thread(self._check_auth_session, project)
+    
+    def _query_auth_users(self, project: ProjectConfig) -> Optional[str]:
+        """Blocking part of _ping_auth_admin, run in a worker thread."""
+        from supabase import AuthError
+        
+        # Use the auth admin API to count users (generates DB activity).
+        # Requires a service role key.
+        try:
+            self._get_client(project).auth.admin.list_users(per_page=1)
+        except (AuthError, httpx.HTTPError) as e:
+            self.logger.debug(f"Error querying auth.users: {e}", project=project.name)
+            return None
+        return "Successfully queried auth.users table"
+    
+    def _check_auth_session(self, project: ProjectConfig) -> Optional[str]:
+        """Blocking part of _ping_auth_session, run in a worker thread."""
+        from supabase import AuthError
+        
+        try:
+            session = self._get_client(project).auth.get_session()
+        except (AuthError, httpx.HTTPError) as e:
+            self.logger.debug(f"Error checking auth session: {e}", project=project.name)
+            return None
+        if session is None:
+            # Without a stored session the SDK answers locally and sends no request
+            self.logger.debug("No auth session to check", project=project.name)
+            return None
+        return "Successfully checked auth session"
     
     def _ping_project(self, project: ProjectConfig) -> PingResult:
+        """Perform a keep-alive ping on a single project (blocking)."""
+        return self.run(self._ping_project_async(project))
+    
+    async def _ping_project_async(self, project: ProjectConfig) -> PingResult:
         """
         Perform a keep-alive ping on a single project.
         
         This creates activity by:
-        1. Attempting to query a health check table
-        2. If table doesn't exist, uses a simple RPC call or auth check
+        1. Querying the health check table (or REST root) directly over HTTP
+        2. If the REST API does not answer, falling back to Supabase SDK
+           auth calls
+        
+        The direct REST ping is always tried first. Among the SDK fallbacks,
+        the one that worked last time for a project is tried first.
+        
+        Blocking Supabase SDK calls run in worker threads so that many
+        projects can be pinged concurrently on one event loop.
         
         Args:
             project: Project configuration
@@ -92,101 +271,66 @@ class SupaKeeper:
             PingResult with status and timing information
         """
         self.logger.debug(f"Pinging project", project=project.name)
-        start_time = time.time()
+        start = time.perf_counter()
+        
+        fallbacks = self._fallbacks
+        cached = self._strategy_cache.get(project.name, 0)
+        order = [cached] + [i for i in range(len(fallbacks)) if i != cached]
+        
+        success = False
+        # Only kept if retry_attempts is zero
+        message = "Unexpected error in ping logic"
         
         for attempt in range(self.config.retry_attempts):
             try:
-                client = self._get_client(project)
-                
-                # Strategy 1: Try to query a specific table if configured
-                if project.table:
-                    response = client.table(project.table).select("*").limit(1).execute()
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    return PingResult(
-                        project_name=project.name,
-                        success=True,
-                        message=f"Successfully queried table '{project.table}'",
-                        response_time_ms=elapsed_ms,
-                    )
-                
-                # Strategy 2: Query auth.users table (always exists in Supabase)
-                try:
-                    # Use the auth admin API to count users (generates DB activity)
-                    # This queries the auth.users table which always exists
-                    response = client.auth.admin.list_users(per_page=1)
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    return PingResult(
-                        project_name=project.name,
-                        success=True,
-                        message="Successfully queried auth.users table",
-                        response_time_ms=elapsed_ms,
-                    )
-                except Exception as e:
-                    self.logger.debug(f"Error querying auth.users: {e}", project=project.name)
-                    # May not have admin access, try alternative approach
-                    pass
-                
-                # Strategy 3: Use auth.get_user() - this always works if auth is enabled
-                # This is a read-only operation that generates database activity
-                try:
-                    # Get session info (works even without a logged-in user)
-                    client.auth.get_session()
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    return PingResult(
-                        project_name=project.name,
-                        success=True,
-                        message="Successfully checked auth session",
-                        response_time_ms=elapsed_ms,
-                    )
-                except Exception:
-                    pass
-                
-                # Strategy 4: Direct REST API health check via PostgREST
-                # Query the root endpoint which always responds
-                import httpx
-                health_url = f"{project.url}/rest/v1/"
-                headers = {
-                    "apikey": project.key,
-                    "Authorization": f"Bearer {project.key}",
-                }
-                with httpx.Client(timeout=30.0) as http_client:
-                    response = http_client.get(health_url, headers=headers)
-                    if response.status_code in (200, 401, 403):
-                        # Any response means the project is active
-                        elapsed_ms = (time.time() - start_time) * 1000
-                        return PingResult(
-                            project_name=project.name,
-                            success=True,
-                            message=f"Successfully pinged REST API (status: {response.status_code})",
-                            response_time_ms=elapsed_ms,
-                        )
-                
-                # If we got here, something unexpected happened
-                raise Exception("All ping strategies failed")
+                strategy_message = await self._ping_rest(project)
+                if strategy_message is not None:
+                    success, message = True, strategy_message
+                    break
+                for index in order:
+                    strategy_message = await fallbacks[index](project)
+                    if strategy_message is not None:
+                        self._strategy_cache[project.name] = index
+                        success, message = True, strategy_message
+                        break
+                else:
+                    raise ConnectionError("All ping strategies failed")
+                break
                 
-            except Exception as e:
+            # Only network failures are retried; anything else is a bug and
+            # propagates. SDK AuthErrors are handled in the worker threads.
+            except (httpx.HTTPError, OSError) as e:
                 if attempt < self.config.retry_attempts - 1:
+                    delay = self._retry_delay(attempt)
                     self.logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying in {self.config.retry_delay}s...",
+                        f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.0f}s...",
                         project=project.name,
                     )
-                    time.sleep(self.config.retry_delay)
+                    await self._sleep(delay)
                 else:
-                    elapsed_ms = (time.time() - start_time) * 1000
-                    return PingResult(
-                        project_name=project.name,
-                        success=False,
-                        message=f"Failed after {self.config.retry_attempts} attempts: {str(e)}",
-                        response_time_ms=elapsed_ms,
-                    )
+                    message = f"Failed after {self.config.retry_attempts} attempts: {str(e)}"
         
-        # Should never reach here, but just in case
+        elapsed_ms = (time.perf_counter() - start) * 1000
         return PingResult(
             project_name=project.name,
-            success=False,
-            message="Unexpected error in ping logic",
+            success=success,
+            message=message,
+            response_time_ms=elapsed_ms,
         )
     
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, capped at MAX_RETRY_DELAY."""
+        delay = min(self.MAX_RETRY_DELAY, self.config.retry_delay * (2 ** attempt))
+        return delay * self._jitter()
+    
+    def _jitter(self) -> float:
+        """Random factor applied to retry delays so projects don't retry in lockstep."""
+        return random.uniform(0.5, 1.5)
+    
+    async def _sleep(self, delay: float) -> None:
+        """Wait between retry attempts."""
+        await asyncio.sleep(delay)
+    
     def ping_all(self, parallel: bool = True) -> list[PingResult]:
         """
         Ping all enabled projects.
@@ -197,45 +341,56 @@ class SupaKeeper:
         Returns:
             List of PingResult for each project
         """
+        return self.run(self.ping_all_async(parallel))
+    
+    async def ping_all_async(self, parallel: bool = True) -> list[PingResult]:
+        """
+        Ping all enabled projects on the running event loop.
+        
+        Args:
+            parallel: Whether to ping projects concurrently
+            
+        Returns:
+            List of PingResult for each project, in configuration order
+        """
         projects = self.config.get_enabled_projects()
+        self.last_success_count = 0
+        self.last_failed_count = 0
         
         if not projects:
             self.logger.warning("No enabled projects to ping")
             return []
         
         self.logger.info(f"Starting keep-alive check for {len(projects)} project(s)")
-        results: list[PingResult] = []
         
         if parallel and len(projects) > 1:
-            # Use thread pool for parallel execution
-            with ThreadPoolExecutor(max_workers=min(len(projects), 10)) as executor:
-                futures = {
-                    executor.submit(self._ping_project, project): project
-                    for project in projects
-                }
-                
-                for future in as_completed(futures):
-                    result = future.result()
-                    results.append(result)
-                    self._log_result(result)
+            # Fan out all pings over the shared HTTP client
+            results = list(await asyncio.gather(
+                *(self._ping_and_log(project) for project in projects)
+            ))
         else:
             # Sequential execution
-            for project in projects:
-                result = self._ping_project(project)
-                results.append(result)
-                self._log_result(result)
+            results = [await self._ping_and_log(project) for project in projects]
         
-        # Send notification if configured
+        # Send notification if configured (queued, does not block)
         self._send_notification(results)
         
         return results
     
+    async def _ping_and_log(self, project: ProjectConfig) -> PingResult:
+        """Ping a project and log the result as soon as it is available."""
+        result = await self._ping_project_async(project)
+        self._log_result(result)
+        return result
+    
     def _log_result(self, result: PingResult) -> None:
-        """Log a ping result."""
+        """Log a ping result and count it towards the cycle totals."""
         if result.success:
+            self.last_success_count += 1
             time_info = f" ({result.response_time_ms:.0f}ms)" if result.response_time_ms else ""
             self.logger.success(f"{result.message}{time_info}", project=result.project_name)
         else:
+            self.last_failed_count += 1
             self.logger.error(result.message, project=result.project_name)
     
     def _send_notification(self, results: list[PingResult]) -> None:
@@ -243,11 +398,8 @@ class SupaKeeper:
         if not self.notifier:
             return
         
-        success_count = sum(1 for r in results if r.success)
-        failed_count = len(results) - success_count
-        
         # Only notify on failures or if this is a summary notification
-        if failed_count > 0:
+        if self.last_failed_count > 0:
             failed_projects = [r for r in results if not r.success]
             self.notifier.send_failure_notification(failed_projects)
         else:
@@ -257,6 +409,15 @@ class SupaKeeper:
         """
         Run a single keep-alive cycle.
         
+        Returns:
+            Tuple of (success_count, failure_count)
+        """
+        return self.run(self.run_once_async())
+    
+    async def run_once_async(self) -> tuple[int, int]:
+        """
+        Run a single keep-alive cycle on the running event loop.
+        
         Returns:
             Tuple of (success_count, failure_count)
         """
@@ -270,18 +431,15 @@ class SupaKeeper:
             if any("No projects" in e for e in errors):
                 return (0, 0)
         
-        results = self.ping_all()
-        
-        success_count = sum(1 for r in results if r.success)
-        failed_count = len(results) - success_count
+        results = await self.ping_all_async()
         
         self.logger.print_status(
             total=len(results),
-            success=success_count,
-            failed=failed_count,
+            success=self.last_success_count,
+            failed=self.last_failed_count,
         )
         
-        return (success_count, failed_count)
+        return (self.last_success_count, self.last_failed_count)
     
     def get_status(self) -> dict:
         """Get current status of all projects."""
@@ -6,28 +6,106 @@ Provides both file and console logging with rich formatting.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.theme import Theme
 
 
-# Custom theme for console output
-SUPAKEEPER_THEME = Theme({
+# Custom theme styles for console output
+_THEME_STYLES = {
     "info": "cyan",
     "warning": "yellow",
     "error": "bold red",
     "success": "bold green",
     "project": "bold magenta",
     "timestamp": "dim",
-})
+}
 
-console = Console(theme=SUPAKEEPER_THEME)
+
+@lru_cache(maxsize=1)
+def get_theme() -> "Theme":
+    """Get the Supakeeper rich theme, importing rich on first use."""
+    from rich.theme import Theme
+    
+    return Theme(_THEME_STYLES)
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared rich console, importing rich on first use."""
+    # rich is only imported once console output is actually needed, which
+    # keeps it off the import path of headless runs
+    from rich.console import Console
+    
+    return Console(theme=get_theme())
+
+
+def __getattr__(name: str):
+    # SUPAKEEPER_THEME and console used to be built at import time; they are
+    # still available, but only import rich when first accessed
+    if name == "SUPAKEEPER_THEME":
+        return get_theme()
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Serializes stopping queue listeners across threads
+_listener_lock = threading.Lock()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes, flushing for warnings or after FLUSH_INTERVAL."""
+    
+    BUFFER_SIZE = 65536
+    
+    # Longest time (seconds) a record may sit in the buffer before the next
+    # record forces a flush
+    FLUSH_INTERVAL = 5.0
+    
+    _defer_flush = False
+    _last_flush = 0.0
+    
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit flushes after every record; let the buffer fill
+        # instead, but get warnings and errors onto disk straight away
+        self._defer_flush = (
+            record.levelno < logging.WARNING
+            and time.monotonic() - self._last_flush < self.FLUSH_INTERVAL
+        )
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self) -> None:
+        # emit holds the handler lock while it defers, so an explicit flush
+        # from another thread waits for it and then writes the buffer out
+        with self.lock:
+            if not self._defer_flush:
+                super().flush()
+                self._last_flush = time.monotonic()
 
 
 class SupakeeperLogger:
@@ -51,79 +129,111 @@ class SupakeeperLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
-        self.logger.handlers.clear()
+        _close_handlers(self.logger)
         
         # Create log directory if needed
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         # File handler with detailed format
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = _BufferedFileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             "%(asctime)s | %(levelname)-8s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self._file_handler = file_handler
         
         # Console handler with rich formatting
+        self._console_handler: Optional[logging.Handler] = None
         if console_output:
+            from rich.logging import RichHandler
+            
             rich_handler = RichHandler(
-                console=console,
+                console=get_console(),
                 show_time=True,
                 show_path=False,
                 rich_tracebacks=True,
             )
             rich_handler.setLevel(getattr(logging, log_level.upper()))
+            # Kept synchronous so log lines stay in order with the banner and
+            # status summary, which are printed straight to the console
             self.logger.addHandler(rich_handler)
+            self._console_handler = rich_handler
+        
+        # Callers only enqueue file records; formatting and disk I/O happen
+        # on the listener's background thread
+        self._log_queue: queue.Queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, respect_handler_level=True
+        )
+        # The handler owns the listener, so whoever closes the handler (this
+        # instance or a later one for the same logger name) also stops it
+        self._queue_handler.listener = listener
+        self.logger.addHandler(self._queue_handler)
+        listener.start()
         
         self.console_output = console_output
+        # Bound once instead of looked up on every record
+        self._emit = self.logger.log
+    
+    def flush(self) -> None:
+        """Process queued records and write any buffered records to the log file."""
+        if self._queue_handler.listener is not None:
+            # Wait for the listener to handle everything queued so far
+            self._log_queue.join()
+        self._file_handler.flush()
+    
+    def shutdown(self) -> None:
+        """Process queued records, stop the listener thread and close the handlers."""
+        self.logger.removeHandler(self._queue_handler)
+        _close_handler(self._queue_handler)
+        if self._console_handler is not None:
+            self.logger.removeHandler(self._console_handler)
+            _close_handler(self._console_handler)
+    
+    def _log(self, level: int, message: str, project: Optional[str] = None) -> None:
+        """Log a message, skipping formatting entirely if the level is disabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+        self._emit(level, f"[{project}] {message}" if project else message)
     
     def info(self, message: str, project: Optional[str] = None) -> None:
         """Log info message."""
-        if project:
-            self.logger.info(f"[{project}] {message}")
-        else:
-            self.logger.info(message)
+        self._log(logging.INFO, message, project)
     
     def success(self, message: str, project: Optional[str] = None) -> None:
         """Log success message (info level with success styling)."""
-        if project:
-            msg = f"[{project}] ✓ {message}"
-        else:
-            msg = f"✓ {message}"
-        self.logger.info(msg)
+        self._log(logging.INFO, f"✓ {message}", project)
     
     def warning(self, message: str, project: Optional[str] = None) -> None:
         """Log warning message."""
-        if project:
-            self.logger.warning(f"[{project}] {message}")
-        else:
-            self.logger.warning(message)
+        self._log(logging.WARNING, message, project)
     
     def error(self, message: str, project: Optional[str] = None) -> None:
         """Log error message."""
-        if project:
-            self.logger.error(f"[{project}] {message}")
-        else:
-            self.logger.error(message)
+        self._log(logging.ERROR, message, project)
     
     def debug(self, message: str, project: Optional[str] = None) -> None:
         """Log debug message."""
-        if project:
-            self.logger.debug(f"[{project}] {message}")
-        else:
-            self.logger.debug(message)
+        self._log(logging.DEBUG, message, project)
     
     def print_banner(self) -> None:
         """Print the Supakeeper banner."""
         if self.console_output:
-            console.print()
-            console.print("[bold cyan]╔═══════════════════════════════════════════╗[/]")
-            console.print("[bold cyan]║[/]   [bold green]Supakeeper[/]  -  Keep Supabase Alive      [bold cyan]║[/]")
-            console.print("[bold cyan]╚═══════════════════════════════════════════╝[/]")
-            console.print()
+            from rich import box
+            from rich.padding import Padding
+            from rich.panel import Panel
+            
+            banner = Panel(
+                "  [bold green]Supakeeper[/]  -  Keep Supabase Alive     ",
+                box=box.DOUBLE,
+                border_style="bold cyan",
+                expand=False,
+            )
+            get_console().print(Padding(banner, (1, 0), expand=False))
     
     def print_status(
         self,
@@ -134,26 +244,71 @@ class SupakeeperLogger:
     ) -> None:
         """Print status summary."""
         if self.console_output:
-            console.print()
-            console.print(f"[bold]Status Summary:[/]")
-            console.print(f"  Total projects: {total}")
-            console.print(f"  [green]Successful: {success}[/]")
+            from rich.padding import Padding
+            from rich.table import Table
+            
+            # Rendered as one table so the summary is written in a single print
+            table = Table(
+                title="Status Summary:",
+                title_style="bold",
+                title_justify="left",
+                show_header=False,
+                box=None,
+                padding=(0, 0, 0, 2),
+            )
+            table.add_row("Total projects:", str(total))
+            table.add_row("[green]Successful:[/]", f"[green]{success}[/]")
             if failed > 0:
-                console.print(f"  [red]Failed: {failed}[/]")
+                table.add_row("[red]Failed:[/]", f"[red]{failed}[/]")
             if next_run:
-                console.print(f"  Next run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-            console.print()
+                table.add_row("Next run:", next_run.strftime('%Y-%m-%d %H:%M:%S'))
+            get_console().print(Padding(table, (1, 0), expand=False))
+
 
+def _close_handler(handler: logging.Handler) -> None:
+    """Flush and close a handler along with its queue listener or buffer target."""
+    with _listener_lock:
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            handler.listener = None
+            listener.stop()
+    if listener is not None:
+        for inner in listener.handlers:
+            _close_handler(inner)
+    target = getattr(handler, "target", None)
+    handler.close()
+    if target is not None:
+        _close_handler(target)
 
-# Global logger instance
+
+def _close_handlers(logger: logging.Logger) -> None:
+    """Detach and close every handler on a logger."""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        _close_handler(handler)
+
+
+# Global logger instance and the (log_file, log_level, console_output) it was built with
 _logger: Optional[SupakeeperLogger] = None
+_logger_settings: Optional[tuple[str, str, bool]] = None
+_logger_lock = threading.Lock()
+
+
+@atexit.register
+def _shutdown_on_exit() -> None:
+    """Write out pending records of the global logger at interpreter exit."""
+    if _logger is not None:
+        _logger.shutdown()
 
 
 def get_logger() -> SupakeeperLogger:
     """Get the global logger instance."""
     global _logger
-    if _logger is None:
-        _logger = SupakeeperLogger()
+    if _logger is not None:
+        return _logger
+    with _logger_lock:
+        if _logger is None:
+            _logger = SupakeeperLogger()
     return _logger
 
 
@@ -162,12 +317,24 @@ def setup_logger(
     log_level: str = "INFO",
     console_output: bool = True,
 ) -> SupakeeperLogger:
-    """Setup and return the global logger instance."""
-    global _logger
-    _logger = SupakeeperLogger(
-        log_file=log_file,
-        log_level=log_level,
-        console_output=console_output,
-    )
+    """
+    Setup and return the global logger instance.
+    
+    The existing logger is reused when the settings are unchanged, so
+    repeated calls don't reopen the log file.
+    """
+    global _logger, _logger_settings
+    settings = (log_file, log_level.upper(), console_output)
+    with _logger_lock:
+        if _logger is not None and _logger_settings == settings:
+            return _logger
+        if _logger is not None:
+            _logger.shutdown()
+        _logger = SupakeeperLogger(
+            log_file=log_file,
+            log_level=log_level,
+            console_output=console_output,
+        )
+        _logger_settings = settings
     return _logger
 
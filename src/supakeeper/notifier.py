@@ -8,6 +8,12 @@ Supports notifications via:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import queue
+import threading
+import time
+import weakref
 from datetime import datetime
 from typing import Optional
 
@@ -16,17 +22,70 @@ import httpx
 from supakeeper.logger import get_logger
 
 
+# Static parts of the notification messages; only counts, project lists and
+# timestamps are filled in per message
+_SUCCESS_EMBED_BASE = {
+    "title": "🎉 Supakeeper - All Projects Active",
+    "color": 5763719,  # Green
+}
+_FAILURE_EMBED_BASE = {
+    "title": "⚠️ Supakeeper - Some Projects Failed",
+    "color": 15548997,  # Red
+}
+_TELEGRAM_SUCCESS_HEADER = "🎉 *Supakeeper - All Projects Active*\n\n"
+_TELEGRAM_FAILURE_HEADER = "⚠️ *Supakeeper - Some Projects Failed*\n\n"
+
+# Notifiers whose worker has been started but not stopped, closed at
+# interpreter exit; weak, so notifiers that never sent anything can be collected
+_live_notifiers: weakref.WeakSet[Notifier] = weakref.WeakSet()
+
+
+def _fmt_success(result) -> str:
+    """Format the line for one successful ping."""
+    return f"✅ {result.project_name} ({result.response_time_ms:.0f}ms)"
+
+
+def _fmt_failure(result) -> str:
+    """Format the line for one failed ping."""
+    return f"❌ {result.project_name}: {result.message}"
+
+
+def _success_lines(results: list) -> str:
+    """Format one line per successful ping."""
+    return "\n".join(map(_fmt_success, results))
+
+
+def _failure_lines(failed_results: list) -> str:
+    """Format one line per failed ping."""
+    return "\n".join(map(_fmt_failure, failed_results))
+
+
 class Notifier:
     """Send notifications about keep-alive status."""
     
     # Telegram Bot API endpoint
     TELEGRAM_API_BASE = "https://api.telegram.org/bot{token}/sendMessage"
     
+    # Notifications waiting for the worker before new ones are dropped
+    QUEUE_SIZE = 1024
+    
+    # Delivery attempts per message, with exponential backoff between them
+    SEND_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5
+    MAX_RETRY_DELAY = 5.0
+    # Upper bound on a server-requested Retry-After wait
+    MAX_RETRY_AFTER = 60.0
+    
+    # Seconds to wait for pending notifications at interpreter exit
+    EXIT_TIMEOUT = 10.0
+    
     def __init__(
         self,
         webhook_url: Optional[str] = None,
         telegram_bot_token: Optional[str] = None,
         telegram_chat_id: Optional[str] = None,
+        coalesce_window_s: float = 1.0,
+        max_batch: int = 50,
     ) -> None:
         """
         Initialize notifier.
@@ -35,97 +94,285 @@ class Notifier:
             webhook_url: URL for webhook notifications (Discord, Slack, etc.)
             telegram_bot_token: Telegram Bot token from @BotFather
             telegram_chat_id: Telegram chat ID to send messages to
+            coalesce_window_s: Seconds to wait for more notifications to merge
+                into the same message
+            max_batch: Maximum number of queued notifications merged at once
         """
         self.webhook_url = webhook_url
         self.telegram_bot_token = telegram_bot_token
         self.telegram_chat_id = telegram_chat_id
+        # Channels are fixed for the notifier's lifetime, so check them once
+        self.has_webhook = bool(webhook_url)
+        self.has_telegram = bool(telegram_bot_token and telegram_chat_id)
+        self.coalesce_window_s = coalesce_window_s
+        self.max_batch = max_batch
         self.logger = get_logger()
+        # Shared HTTP client so repeated notifications reuse connections
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            headers={"Content-Type": "application/json"},
+        )
+        # Private event loop, created and driven by the worker thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Sends are queued and delivered in the background so callers never
+        # wait on the network; None is the shutdown sentinel
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        # Worker thread, started by the first queued notification
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
     
-    @property
-    def has_webhook(self) -> bool:
-        """Check if webhook is configured."""
-        return bool(self.webhook_url)
+    def _start_worker(self) -> None:
+        """Start the delivery thread if it is not running yet."""
+        with self._worker_lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._drain, name="supakeeper-notifier", daemon=True
+            )
+            self._worker.start()
+            _live_notifiers.add(self)
     
-    @property
-    def has_telegram(self) -> bool:
-        """Check if Telegram is configured."""
-        return bool(self.telegram_bot_token and self.telegram_chat_id)
+    def _run(self, coro):
+        """Run a coroutine to completion on the notifier's event loop."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
     
-    def send_success_notification(self, results: list) -> None:
-        """Send notification for successful pings."""
+    def _next_batch(self) -> list:
+        """
+        Block for the next notification, then collect any that follow it.
+        
+        Returns:
+            Queued items in arrival order, ending early at the shutdown sentinel
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.coalesce_window_s
+        while batch[-1] is not None and len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _drain(self) -> None:
+        """Deliver queued notifications until the shutdown sentinel arrives."""
+        stopping = False
+        while not stopping:
+            batch = self._next_batch()
+            stopping = batch[-1] is None
+            items = batch[:-1] if stopping else batch
+            try:
+                if items:
+                    self._run(self._deliver(items))
+            except Exception as e:
+                self.logger.error(f"Failed to deliver notification: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        
+        if self._loop is not None:
+            self._loop.run_until_complete(self._aclose())
+            self._loop.close()
+            self._loop = None
+    
+    def _enqueue(self, kind: str, results: list) -> None:
+        """Hand a notification to the worker thread without blocking."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._start_worker()
+        try:
+            self._queue.put_nowait((kind, results, timestamp))
+        except queue.Full:
+            self.logger.warning("Notification queue is full, dropping notification")
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued notifications to be delivered.
         
-        # Send via webhook if configured
-        if self.has_webhook:
-            message = self._build_success_message(results, timestamp)
-            self._send_webhook(message)
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the queue was drained, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+    
+    async def _aclose(self) -> None:
+        """Close the underlying HTTP connections (on the worker's loop)."""
+        await self._client.aclose()
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Deliver pending notifications, then stop the worker thread.
         
-        # Send via Telegram if configured
-        if self.has_telegram:
-            text = self._build_telegram_success_message(results, timestamp)
-            self._send_telegram(text)
+        Args:
+            timeout: Maximum seconds to wait for the worker, or None to wait indefinitely
+        """
+        _live_notifiers.discard(self)
+        if self._worker is None or not self._worker.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Notification queue did not drain, abandoning pending notifications")
+            return
+        self._worker.join(timeout)
+    
+    def __enter__(self) -> "Notifier":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def send_success_notification(self, results: list) -> None:
+        """Send notification for successful pings."""
+        if not (self.has_webhook or self.has_telegram):
+            return
+        self._enqueue("success", results)
     
     def send_failure_notification(self, failed_results: list) -> None:
         """Send notification for failed pings."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if not (self.has_webhook or self.has_telegram):
+            return
+        self._enqueue("failure", failed_results)
+    
+    async def _deliver(self, batch: list) -> None:
+        """
+        Merge a batch of queued notifications and send one message per kind.
+        
+        Args:
+            batch: (kind, results, timestamp) tuples in arrival order
+        """
+        merged: dict[str, list] = {}
+        timestamps: dict[str, str] = {}
+        for kind, results, timestamp in batch:
+            merged.setdefault(kind, []).extend(results)
+            timestamps[kind] = timestamp
+        
+        # Each project list is formatted once and shared by both channels
+        sends = []
+        if "success" in merged:
+            results, timestamp = merged["success"], timestamps["success"]
+            project_list = _success_lines(results)
+            sends.append(self._dispatch(
+                self._build_success_message(len(results), project_list, timestamp) if self.has_webhook else None,
+                self._build_telegram_success_message(len(results), project_list, timestamp) if self.has_telegram else None,
+            ))
+        if "failure" in merged:
+            results, timestamp = merged["failure"], timestamps["failure"]
+            project_list = _failure_lines(results)
+            sends.append(self._dispatch(
+                self._build_failure_message(len(results), project_list, timestamp) if self.has_webhook else None,
+                self._build_telegram_failure_message(len(results), project_list, timestamp) if self.has_telegram else None,
+            ))
+        await asyncio.gather(*sends)
+    
+    async def _dispatch(self, webhook_payload: Optional[dict], telegram_text: Optional[str]) -> None:
+        """
+        Send to every configured channel concurrently.
+        
+        Args:
+            webhook_payload: Webhook JSON payload, or None to skip the webhook
+            telegram_text: Telegram message text, or None to skip Telegram
+        """
+        sends = []
+        if webhook_payload is not None:
+            sends.append(self._send_webhook_async(webhook_payload))
+        if telegram_text is not None:
+            sends.append(self._send_telegram_async(telegram_text))
+        
+        # Total latency is the slowest channel rather than the sum
+        await asyncio.gather(*sends)
+    
+    async def _post(self, url: str, payload: dict) -> httpx.Response:
+        """
+        POST a JSON payload, retrying rate limits, server errors and network failures.
         
-        # Send via webhook if configured
-        if self.has_webhook:
-            message = self._build_failure_message(failed_results, timestamp)
-            self._send_webhook(message)
+        Retries sleep on the notifier's event loop, so they only ever delay
+        the background worker.
         
-        # Send via Telegram if configured
-        if self.has_telegram:
-            text = self._build_telegram_failure_message(failed_results, timestamp)
-            self._send_telegram(text)
+        Args:
+            url: URL to post to
+            payload: JSON payload to send
+            
+        Returns:
+            The last response received
+            
+        Raises:
+            httpx.HTTPError: If the final attempt fails at the network level
+        """
+        for attempt in range(self.SEND_ATTEMPTS):
+            is_last = attempt == self.SEND_ATTEMPTS - 1
+            try:
+                response = await self._client.post(url, json=payload)
+            except httpx.HTTPError as e:
+                if is_last:
+                    raise
+                delay = self._retry_delay(attempt)
+                reason = str(e)
+            else:
+                if is_last or not (response.status_code == 429 or response.status_code >= 500):
+                    return response
+                delay = self._retry_delay(attempt, response)
+                reason = f"status {response.status_code}"
+            
+            self.logger.debug(f"Notification attempt {attempt + 1} failed ({reason}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Honor Retry-After on rate limits, otherwise back off exponentially."""
+        if response is not None and response.status_code == 429:
+            try:
+                return min(self.MAX_RETRY_AFTER, float(response.headers["Retry-After"]))
+            except (KeyError, ValueError):
+                pass
+        return min(self.MAX_RETRY_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt))
     
     # ========================================
     # Webhook methods (Discord, Slack, etc.)
     # ========================================
     
-    def _build_success_message(self, results: list, timestamp: str) -> dict:
+    def _build_success_message(self, count: int, project_list: str, timestamp: str) -> dict:
         """Build success notification message for webhook."""
-        project_list = "\n".join(
-            f"✅ {r.project_name} ({r.response_time_ms:.0f}ms)"
-            for r in results
-        )
-        
         # Discord embed format (also works with many other webhooks)
         return {
             "embeds": [
                 {
-                    "title": "🎉 Supakeeper - All Projects Active",
-                    "description": f"Successfully pinged {len(results)} project(s):\n\n{project_list}",
-                    "color": 5763719,  # Green
+                    **_SUCCESS_EMBED_BASE,
+                    "description": f"Successfully pinged {count} project(s):\n\n{project_list}",
                     "footer": {"text": f"Supakeeper | {timestamp}"},
                 }
             ],
             # Slack format fallback
-            "text": f"✅ Supakeeper: Successfully pinged {len(results)} project(s)",
+            "text": f"✅ Supakeeper: Successfully pinged {count} project(s)",
         }
     
-    def _build_failure_message(self, failed_results: list, timestamp: str) -> dict:
+    def _build_failure_message(self, count: int, project_list: str, timestamp: str) -> dict:
         """Build failure notification message for webhook."""
-        project_list = "\n".join(
-            f"❌ {r.project_name}: {r.message}"
-            for r in failed_results
-        )
-        
         # Discord embed format
         return {
             "embeds": [
                 {
-                    "title": "⚠️ Supakeeper - Some Projects Failed",
-                    "description": f"Failed to ping {len(failed_results)} project(s):\n\n{project_list}",
-                    "color": 15548997,  # Red
+                    **_FAILURE_EMBED_BASE,
+                    "description": f"Failed to ping {count} project(s):\n\n{project_list}",
                     "footer": {"text": f"Supakeeper | {timestamp}"},
                 }
             ],
             # Slack format fallback
-            "text": f"⚠️ Supakeeper: Failed to ping {len(failed_results)} project(s)",
+            "text": f"⚠️ Supakeeper: Failed to ping {count} project(s)",
         }
     
-    def _send_webhook(self, payload: dict) -> bool:
+    async def _send_webhook_async(self, payload: dict) -> bool:
         """
         Send webhook notification.
         
@@ -135,26 +382,21 @@ class Notifier:
         Returns:
             True if successful, False otherwise
         """
-        if not self.webhook_url:
+        if not self.has_webhook:
             return False
         
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
+            response = await self._post(self.webhook_url, payload)
+            
+            if response.status_code in (200, 204):
+                self.logger.debug("Webhook notification sent successfully")
+                return True
+            else:
+                self.logger.warning(
+                    f"Webhook returned status {response.status_code}: {response.text}"
                 )
+                return False
                 
-                if response.status_code in (200, 204):
-                    self.logger.debug("Webhook notification sent successfully")
-                    return True
-                else:
-                    self.logger.warning(
-                        f"Webhook returned status {response.status_code}: {response.text}"
-                    )
-                    return False
-                    
         except Exception as e:
             self.logger.error(f"Failed to send webhook notification: {e}")
             return False
@@ -163,35 +405,25 @@ class Notifier:
     # Telegram Bot API methods
     # ========================================
     
-    def _build_telegram_success_message(self, results: list, timestamp: str) -> str:
+    def _build_telegram_success_message(self, count: int, project_list: str, timestamp: str) -> str:
         """Build success notification message for Telegram."""
-        project_list = "\n".join(
-            f"✅ {r.project_name} ({r.response_time_ms:.0f}ms)"
-            for r in results
-        )
-        
         return (
-            f"🎉 *Supakeeper - All Projects Active*\n\n"
-            f"Successfully pinged {len(results)} project(s):\n\n"
+            f"{_TELEGRAM_SUCCESS_HEADER}"
+            f"Successfully pinged {count} project(s):\n\n"
             f"{project_list}\n\n"
             f"_{timestamp}_"
         )
     
-    def _build_telegram_failure_message(self, failed_results: list, timestamp: str) -> str:
+    def _build_telegram_failure_message(self, count: int, project_list: str, timestamp: str) -> str:
         """Build failure notification message for Telegram."""
-        project_list = "\n".join(
-            f"❌ {r.project_name}: {r.message}"
-            for r in failed_results
-        )
-        
         return (
-            f"⚠️ *Supakeeper - Some Projects Failed*\n\n"
-            f"Failed to ping {len(failed_results)} project(s):\n\n"
+            f"{_TELEGRAM_FAILURE_HEADER}"
+            f"Failed to ping {count} project(s):\n\n"
             f"{project_list}\n\n"
             f"_{timestamp}_"
         )
     
-    def _send_telegram(self, text: str, parse_mode: str = "Markdown") -> bool:
+    async def _send_telegram_async(self, text: str, parse_mode: str = "Markdown") -> bool:
         """
         Send message via Telegram Bot API.
         
@@ -220,26 +452,28 @@ class Notifier:
         }
         
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                
-                result = response.json()
+            response = await self._post(url, payload)
+            
+            # The Bot API only answers 200 with "ok": true, so the body is
+            # only worth decoding for the error details
+            if response.status_code == 200:
+                self.logger.debug("Telegram notification sent successfully")
+                return True
+            
+            result = response.json()
+            error_desc = result.get("description", "Unknown error")
+            self.logger.warning(
+                f"Telegram API error: {error_desc} (code: {result.get('error_code')})"
+            )
+            return False
                 
-                if response.status_code == 200 and result.get("ok"):
-                    self.logger.debug("Telegram notification sent successfully")
-                    return True
-                else:
-                    error_desc = result.get("description", "Unknown error")
-                    self.logger.warning(
-                        f"Telegram API error: {error_desc} (code: {result.get('error_code')})"
-                    )
-                    return False
-                    
         except Exception as e:
             self.logger.error(f"Failed to send Telegram notification: {e}")
             return False
-    
+
+
+@atexit.register
+def _close_on_exit() -> None:
+    """Deliver notifications still queued by notifiers that were never closed."""
+    for notifier in list(_live_notifiers):
+        notifier.close(timeout=Notifier.EXIT_TIMEOUT)
@@ -2,18 +2,18 @@
 Scheduler for periodic keep-alive operations.
 
 Provides both daemon mode (continuous running) and single-run mode.
+The daemon loop is a coroutine; run_daemon drives the same loop on the
+keeper's own event loop for blocking callers.
 """
 
 from __future__ import annotations
 
+import asyncio
 import signal
 import sys
-import time
 from datetime import datetime, timedelta
 from typing import Callable, Optional
 
-import schedule
-
 from supakeeper.config import Config
 from supakeeper.keeper import SupaKeeper
 from supakeeper.logger import get_logger
@@ -22,6 +22,9 @@ from supakeeper.logger import get_logger
 class Scheduler:
     """Schedule and run keep-alive operations."""
     
+    # Seconds to wait for queued notifications on shutdown
+    NOTIFY_FLUSH_TIMEOUT = 10.0
+    
     def __init__(self, keeper: SupaKeeper) -> None:
         """
         Initialize scheduler.
@@ -31,8 +34,12 @@ class Scheduler:
         """
         self.keeper = keeper
         self.logger = get_logger()
+        self._interval = timedelta(hours=keeper.config.interval_hours)
         self._running = False
         self._next_run: Optional[datetime] = None
+        # Set while the daemon loop is active, so signals can wake it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -40,55 +47,119 @@ class Scheduler:
     
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle shutdown signals."""
-        self.logger.info("Received shutdown signal, stopping scheduler...")
+        # Only flip flags here: the signal may interrupt code holding a logging
+        # or queue lock, so logging and flushing happen once the loop has exited
         self._running = False
+        if self._loop is not None and self._async_stop is not None:
+            self._loop.call_soon_threadsafe(self._async_stop.set)
+    
+    def reload_interval(self) -> None:
+        """Pick up a changed interval_hours from the keeper's configuration."""
+        self._interval = timedelta(hours=self.keeper.config.interval_hours)
     
-    def _run_job(self) -> None:
-        """Execute the keep-alive job."""
+    async def _run_job_async(self) -> None:
+        """Execute the keep-alive job on the running event loop."""
         self.logger.info("=" * 50)
         self.logger.info(f"Running scheduled keep-alive at {datetime.now()}")
         
-        success, failed = self.keeper.run_once()
+        success, failed = await self.keeper.run_once_async()
         
-        # Calculate next run time
-        interval_hours = self.keeper.config.interval_hours
-        self._next_run = datetime.now() + timedelta(hours=interval_hours)
+        self._schedule_next_run()
+        # File logs are batched; get this cycle onto disk before sleeping
+        await asyncio.to_thread(self.logger.flush)
+    
+    def _schedule_next_run(self) -> None:
+        """Calculate and log the next run time."""
+        self._next_run = datetime.now() + self._interval
         
         self.logger.info(f"Next run scheduled for: {self._next_run}")
     
     def run_daemon(self, run_immediately: bool = True) -> None:
         """
-        Run the scheduler as a daemon (continuous mode).
+        Run the scheduler as a daemon (continuous mode), blocking until stopped.
+        
+        Drives run_daemon_async on the keeper's event loop.
         
         Args:
             run_immediately: Whether to run immediately on start
         """
-        interval_hours = self.keeper.config.interval_hours
-        
-        self.logger.info(f"Starting Supakeeper daemon (interval: {interval_hours} hours)")
+        try:
+            self.keeper.run(self.run_daemon_async(run_immediately))
+        finally:
+            self.keeper.close()
+    
+    async def run_daemon_async(self, run_immediately: bool = True) -> None:
+        """
+        Run the scheduler as a daemon on the running event loop.
         
-        if run_immediately:
-            self._run_job()
+        Sleeps with asyncio between cycles instead of blocking a thread,
+        and wakes immediately when a shutdown signal is received.
         
-        # Schedule recurring job
-        schedule.every(interval_hours).hours.do(self._run_job)
+        Args:
+            run_immediately: Whether to run immediately on start
+        """
+        self.logger.info(f"Starting Supakeeper daemon (interval: {self.keeper.config.interval_hours} hours)")
         
+        self._loop = asyncio.get_running_loop()
+        self._async_stop = asyncio.Event()
         self._running = True
+        # Fixed-rate schedule on the loop's monotonic clock, so job runtime doesn't drift it
+        interval = self._interval.total_seconds()
+        next_run = self._loop.time() + interval
         
-        while self._running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        try:
+            if run_immediately:
+                await self._run_job_async()
+            
+            while self._running:
+                try:
+                    await asyncio.wait_for(
+                        self._async_stop.wait(),
+                        timeout=max(0.0, next_run - self._loop.time()),
+                    )
+                except asyncio.TimeoutError:
+                    await self._run_job_async()
+                    next_run += interval
+            
+            self.logger.info("Received shutdown signal, stopping scheduler...")
+        finally:
+            self._loop = None
+            self._async_stop = None
+            if self.keeper.notifier:
+                await asyncio.to_thread(self.keeper.notifier.flush, self.NOTIFY_FLUSH_TIMEOUT)
+            await self.keeper.aclose()
         
         self.logger.info("Scheduler stopped")
+        await asyncio.to_thread(self.logger.flush)
     
     def run_once(self) -> tuple[int, int]:
         """
-        Run a single keep-alive cycle.
+        Run a single keep-alive cycle and release the keeper's resources.
         
         Returns:
             Tuple of (success_count, failure_count)
         """
-        return self.keeper.run_once()
+        try:
+            return self.keeper.run_once()
+        finally:
+            self.keeper.close()
+
+
+def use_uvloop() -> bool:
+    """
+    Switch asyncio to the uvloop event loop if it is installed.
+    
+    Must be called before any event loop is created.
+    
+    Returns:
+        True if uvloop is now in use, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 def create_scheduler(config: Optional[Config] = None) -> Scheduler:
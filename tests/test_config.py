@@ -1,10 +1,11 @@
 """Tests for configuration loading and validation."""
 
+import copy
 import os
 
 import pytest
 
-from supakeeper.config import Config, ProjectConfig
+from supakeeper.config import Config, ProjectConfig, _read_dotenv
 
 
 class TestProjectConfig:
@@ -48,6 +49,45 @@ class TestProjectConfig:
                 url="http://test.supabase.co",
                 key="test-key",
             )
+    
+    def test_ping_request_precomputed(self):
+        """Test that the REST ping URL and headers are built at construction."""
+        project = ProjectConfig(
+            name="Test",
+            url="https://test.supabase.co/",
+            key="test-key",
+        )
+        assert project.ping_url == "https://test.supabase.co/rest/v1/"
+        assert project.ping_headers["apikey"] == "test-key"
+        with pytest.raises(TypeError):
+            project.ping_headers["apikey"] = "other"
+        
+        project.table = "health"
+        assert project.ping_url == "https://test.supabase.co/rest/v1/health?select=*&limit=1"
+    
+    def test_deepcopy(self):
+        """Test that copies rebuild their own ping request."""
+        project = ProjectConfig(name="Test", url="https://test.supabase.co", key="k", table="t")
+        clone = copy.deepcopy(project)
+        
+        assert clone == project
+        assert clone.ping_url == project.ping_url
+        clone.table = None
+        assert project.table == "t"
+    
+    def test_invalid_url_assignment_raises_error(self):
+        """Test that changing the URL after construction is validated too."""
+        project = ProjectConfig(
+            name="Test",
+            url="https://test.supabase.co",
+            key="test-key",
+        )
+        with pytest.raises(ValueError, match="must start with https://"):
+            project.url = "http://test.supabase.co"
+        
+        # The rejected value is not kept
+        assert project.url == "https://test.supabase.co"
+        assert project.ping_url == "https://test.supabase.co/rest/v1/"
 
 
 class TestConfig:
@@ -73,6 +113,30 @@ class TestConfig:
         assert len(enabled) == 1
         assert enabled[0].name == "Enabled"
     
+    def test_get_enabled_projects_sees_project_changes(self):
+        """Test that disabling a project in place removes it from the enabled list."""
+        config = Config(projects=[
+            ProjectConfig(name="Enabled", url="https://a.supabase.co", key="k1"),
+        ])
+        assert config.get_enabled_projects() == config.projects
+        
+        config.projects[0].enabled = False
+        assert config.get_enabled_projects() == []
+    
+    def test_get_project_by_name(self):
+        """Test case-insensitive project lookup by name."""
+        config = Config(projects=[
+            ProjectConfig(name="Main", url="https://a.supabase.co", key="k1"),
+            ProjectConfig(name="Side", url="https://b.supabase.co", key="k2"),
+        ])
+        
+        assert config.get_project("side").url == "https://b.supabase.co"
+        assert config.get_project("missing") is None
+        
+        # In-place changes to the project list are seen straight away
+        config.projects.pop()
+        assert config.get_project("side") is None
+    
     def test_validate_no_projects(self):
         """Test validation with no projects configured."""
         config = Config(projects=[])
@@ -90,6 +154,16 @@ class TestConfig:
         errors = config.validate()
         assert any("168 hours" in e for e in errors)
     
+    def test_validate_sees_project_list_changes(self):
+        """Test that projects added in place are picked up by a later validate."""
+        config = Config(projects=[])
+        assert any("No projects" in e for e in config.validate())
+        
+        config.projects.append(
+            ProjectConfig(name="Test", url="https://t.supabase.co", key="k"),
+        )
+        assert config.validate() == []
+    
     def test_load_single_project_from_env(self):
         """Test loading single project from environment variables."""
         os.environ["SUPABASE_URL"] = "https://env-test.supabase.co"
@@ -142,3 +216,34 @@ class TestConfig:
                        "SUPABASE_URL_2", "SUPABASE_KEY_2", "SUPABASE_NAME_2"]:
                 if key in os.environ:
                     del os.environ[key]
+    
+    def test_load_ignores_non_numeric_suffix(self):
+        """Test that only SUPABASE_URL_<digits> variables define projects."""
+        os.environ["SUPABASE_URL_ABC"] = "https://ignored.supabase.co"
+        os.environ["SUPABASE_KEY_ABC"] = "ignored-key"
+        
+        try:
+            config = Config.load()
+            urls = [p.url for p in config.projects]
+            assert "https://ignored.supabase.co" not in urls
+        finally:
+            del os.environ["SUPABASE_URL_ABC"]
+            del os.environ["SUPABASE_KEY_ABC"]
+
+
+class TestDotenvCache:
+    """Tests for .env parsing cache."""
+    
+    def test_reparses_only_when_mtime_changes(self, tmp_path):
+        """Test that a .env file is parsed once per modification time."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SUPABASE_URL=https://a.supabase.co\n")
+        path = str(env_file)
+        mtime = os.stat(path).st_mtime
+        
+        first = _read_dotenv(path, mtime)
+        assert _read_dotenv(path, mtime) is first
+        
+        env_file.write_text("SUPABASE_URL=https://b.supabase.co\n")
+        updated = _read_dotenv(path, mtime + 1)
+        assert updated["SUPABASE_URL"] == "https://b.supabase.co"
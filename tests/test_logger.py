@@ -0,0 +1,129 @@
+"""Tests for the logging wrapper."""
+
+import threading
+import time
+
+from supakeeper.logger import SupakeeperLogger, _BufferedFileHandler, setup_logger
+
+
+class TestSupakeeperLogger:
+    """Tests for SupakeeperLogger class."""
+    
+    def test_project_prefix(self, tmp_path, mocker):
+        """Test that messages are prefixed with the project name."""
+        logger = SupakeeperLogger(log_file=str(tmp_path / "test.log"), console_output=False)
+        
+        emit = mocker.patch.object(logger, "_emit")
+        logger.success("pinged", project="P")
+        
+        assert emit.call_args.args[1] == "[P] ✓ pinged"
+    
+    def test_disabled_level_skips_formatting(self, tmp_path, mocker):
+        """Test that filtered-out levels never reach the underlying logger."""
+        logger = SupakeeperLogger(log_file=str(tmp_path / "test.log"), log_level="INFO", console_output=False)
+        
+        emit = mocker.patch.object(logger, "_emit")
+        logger.debug("details", project="P")
+        
+        emit.assert_not_called()
+    
+    def test_file_writes_are_buffered_until_warning(self, tmp_path):
+        """Test that file records are batched but warnings are written at once."""
+        log_file = tmp_path / "test.log"
+        logger = SupakeeperLogger(log_file=str(log_file), console_output=False)
+        logger._file_handler._last_flush = time.monotonic()
+        
+        logger.info("first")
+        logger._log_queue.join()
+        assert "first" not in log_file.read_text()
+        
+        logger.warning("careful")
+        logger._log_queue.join()
+        contents = log_file.read_text()
+        assert "first" in contents and "careful" in contents
+        logger.shutdown()
+    
+    def test_file_writes_are_flushed_after_interval(self, tmp_path):
+        """Test that an old buffered record is written out by the next one."""
+        log_file = tmp_path / "test.log"
+        logger = SupakeeperLogger(log_file=str(log_file), console_output=False)
+        handler = logger._file_handler
+        handler._last_flush = time.monotonic() - handler.FLUSH_INTERVAL
+        
+        logger.info("late")
+        logger._log_queue.join()
+        
+        assert "late" in log_file.read_text()
+        logger.shutdown()
+    
+    def test_console_output_is_synchronous(self, tmp_path, capsys):
+        """Test that console lines are printed before the log call returns."""
+        logger = SupakeeperLogger(log_file=str(tmp_path / "test.log"), console_output=True)
+        
+        logger.info("hello")
+        
+        assert "hello" in capsys.readouterr().out
+        logger.shutdown()
+    
+    def test_console_and_theme_still_importable(self):
+        """Test that the module-level console and theme remain available."""
+        from rich.theme import Theme
+        
+        from supakeeper.logger import SUPAKEEPER_THEME, console, get_console
+        
+        assert isinstance(SUPAKEEPER_THEME, Theme)
+        assert console is get_console()
+    
+    def test_shutdown_writes_pending_records(self, tmp_path):
+        """Test that shutdown drains the queue and the file buffer."""
+        log_file = tmp_path / "test.log"
+        logger = SupakeeperLogger(log_file=str(log_file), console_output=False)
+        
+        logger.info("queued")
+        logger.shutdown()
+        
+        assert "queued" in log_file.read_text()
+        assert not logger.logger.handlers
+    
+    def test_setup_logger_reuses_unchanged_settings(self, tmp_path):
+        """Test that setup_logger only rebuilds the logger when settings change."""
+        log_file = str(tmp_path / "test.log")
+        first = setup_logger(log_file=log_file, console_output=False)
+        
+        assert setup_logger(log_file=log_file, console_output=False) is first
+        
+        second = setup_logger(log_file=log_file, log_level="DEBUG", console_output=False)
+        assert second is not first
+        assert first._queue_handler.listener is None
+    
+    def test_flush_writes_buffered_records(self, tmp_path):
+        """Test that flush pushes records through the memory and file buffers."""
+        log_file = tmp_path / "test.log"
+        logger = SupakeeperLogger(log_file=str(log_file), console_output=False)
+        
+        listener_thread = logger._queue_handler.listener._thread
+        logger.info("pending")
+        logger.flush()
+        
+        assert "pending" in log_file.read_text()
+        # The queue is drained in place rather than by restarting the listener
+        assert logger._queue_handler.listener._thread is listener_thread
+        logger.shutdown()
+    
+    def test_explicit_flush_waits_for_deferred_emit(self, tmp_path):
+        """Test that a flush racing a deferring emit still writes the buffer."""
+        log_file = tmp_path / "test.log"
+        handler = _BufferedFileHandler(str(log_file), encoding="utf-8")
+        
+        # Hold the handler the way emit does while it defers flushing
+        with handler.lock:
+            handler._defer_flush = True
+            handler.stream.write("pending\n")
+            flusher = threading.Thread(target=handler.flush)
+            flusher.start()
+            flusher.join(timeout=0.1)
+            handler._defer_flush = False
+        flusher.join(timeout=1)
+        
+        assert "pending" in log_file.read_text()
+        handler.close()
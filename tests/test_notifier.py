@@ -0,0 +1,138 @@
+"""Tests for the notification system."""
+
+import threading
+
+import httpx
+
+from supakeeper import notifier as notifier_module
+from supakeeper.keeper import PingResult
+from supakeeper.notifier import Notifier
+
+
+def mock_transport(notifier: Notifier, status_code: int = 200, json=None) -> list[httpx.Request]:
+    """Answer the notifier's requests with a fixed response; return the requests seen."""
+    requests: list[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=json if json is not None else {"ok": True})
+    
+    notifier._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers={"Content-Type": "application/json"},
+    )
+    return requests
+
+
+class TestNotifier:
+    """Tests for Notifier class."""
+    
+    def test_webhook_and_telegram_share_client(self):
+        """Test that both sinks are sent through the notifier's client."""
+        notifier = Notifier(
+            webhook_url="https://hooks.example.com/abc",
+            telegram_bot_token="123:token",
+            telegram_chat_id="42",
+        )
+        requests = mock_transport(notifier)
+        
+        results = [PingResult(project_name="P", success=True, message="OK", response_time_ms=5)]
+        with notifier:
+            notifier.send_success_notification(results)
+        
+        assert {r.url.host for r in requests} == {"hooks.example.com", "api.telegram.org"}
+        assert all(r.headers["Content-Type"] == "application/json" for r in requests)
+    
+    async def test_failed_webhook_returns_false(self):
+        """Test that a non-2xx webhook response is reported as failure."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc")
+        mock_transport(notifier, status_code=400)
+        
+        assert await notifier._send_webhook_async({"text": "hi"}) is False
+        notifier.close()
+    
+    def test_send_does_not_block_on_network(self):
+        """Test that sends are queued and delivered by the worker thread."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc", coalesce_window_s=0)
+        release = threading.Event()
+        delivered = []
+        
+        async def handler(request: httpx.Request) -> httpx.Response:
+            release.wait(5)
+            delivered.append(request)
+            return httpx.Response(204)
+        
+        notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = [PingResult(project_name="P", success=False, message="down")]
+        notifier.send_failure_notification(results)
+        
+        assert notifier.flush(timeout=0.05) is False
+        release.set()
+        assert notifier.flush(timeout=5) is True
+        assert len(delivered) == 1
+        notifier.close()
+    
+    def test_rapid_notifications_are_coalesced(self):
+        """Test that notifications queued within the window become one message."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc", coalesce_window_s=0.2)
+        requests = mock_transport(notifier)
+        
+        with notifier:
+            for name in ("A", "B", "C"):
+                notifier.send_failure_notification(
+                    [PingResult(project_name=name, success=False, message="down")]
+                )
+            assert notifier.flush(timeout=5) is True
+        
+        assert len(requests) == 1
+        assert b"Failed to ping 3 project(s)" in requests[0].content
+    
+    async def test_rate_limited_webhook_is_retried(self):
+        """Test that a 429 is retried after the server's Retry-After delay."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc")
+        responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(204)]
+        requests = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return responses.pop(0)
+        
+        notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        assert await notifier._send_webhook_async({"text": "hi"}) is True
+        assert len(requests) == 2
+        notifier.close()
+    
+    def test_no_channels_skips_queue(self):
+        """Test that nothing is queued when no channel is configured."""
+        notifier = Notifier()
+        
+        with notifier:
+            notifier.send_success_notification([PingResult(project_name="P", success=True, message="OK")])
+            assert notifier._queue.unfinished_tasks == 0
+            assert notifier._worker is None
+    
+    def test_worker_starts_on_first_notification(self):
+        """Test that no thread is started until something is queued."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc")
+        mock_transport(notifier)
+        assert notifier._worker is None
+        assert notifier not in notifier_module._live_notifiers
+        
+        with notifier:
+            notifier.send_failure_notification([PingResult(project_name="P", success=False, message="down")])
+            assert notifier._worker.is_alive()
+            assert notifier in notifier_module._live_notifiers
+    
+    def test_unclosed_notifier_delivers_at_exit(self):
+        """Test that notifications of a notifier never closed are sent at exit."""
+        notifier = Notifier(webhook_url="https://hooks.example.com/abc")
+        requests = mock_transport(notifier)
+        
+        notifier.send_success_notification(
+            [PingResult(project_name="P", success=True, message="OK", response_time_ms=5)]
+        )
+        notifier_module._close_on_exit()
+        
+        assert len(requests) == 1
+        assert notifier not in notifier_module._live_notifiers
@@ -0,0 +1,333 @@
+"""Tests for SupaKeeper keep-alive pings."""
+
+import inspect
+import threading
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import pytest_asyncio
+from supabase import AuthError
+
+from supakeeper import keeper as keeper_module
+from supakeeper.config import Config, ProjectConfig
+from supakeeper.keeper import SupaKeeper
+
+
+# Single-project configuration shared by read-only tests; never mutate it
+_PROTO = Config(
+    projects=[
+        ProjectConfig(
+            name="Test Project",
+            url="https://test.supabase.co",
+            key="test-key",
+        ),
+    ],
+    console_output=False,
+)
+
+# Stand-in response for fake SDK calls; the keeper never inspects it
+_OK = object()
+
+# Errors raised by the fake SDK, built once and reused
+_AUTH_DENIED = AuthError("Not allowed", None)
+_SDK_BUG = RuntimeError("bug")
+
+
+class FakeSupabaseClient:
+    """Stand-in for the parts of supabase.Client the keeper's SDK fallbacks use."""
+    
+    def __init__(
+        self,
+        list_users_error: Optional[Exception] = None,
+        session: Optional[object] = _OK,
+    ) -> None:
+        self.list_users_error = list_users_error
+        self.session = session
+        self.list_users_calls = 0
+        self.get_session_calls = 0
+        self.auth = SimpleNamespace(
+            admin=SimpleNamespace(list_users=self._list_users),
+            get_session=self._get_session,
+        )
+    
+    # Same parameters as the SDK methods they stand in for
+    def _list_users(self, page: Optional[int] = None, per_page: Optional[int] = None) -> object:
+        self.list_users_calls += 1
+        if self.list_users_error is not None:
+            raise self.list_users_error
+        return _OK
+    
+    def _get_session(self) -> Optional[object]:
+        self.get_session_calls += 1
+        return self.session
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_create_client(module_mocker):
+    """Stub out Supabase client creation once for the whole module."""
+    return module_mocker.patch.object(keeper_module, "create_client")
+
+
+@pytest.fixture(autouse=True)
+def patch_create_client(_patched_create_client):
+    """The module's create_client stub, reset so each test sees a fresh client."""
+    _patched_create_client.reset_mock(side_effect=True)
+    _patched_create_client.return_value = FakeSupabaseClient()
+    return _patched_create_client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Keep mocked Supabase clients from leaking between tests."""
+    keeper_module._CLIENT_CACHE.clear()
+    yield
+    keeper_module._CLIENT_CACHE.clear()
+
+
+@pytest.fixture(scope="module")
+def keeper():
+    """Keeper shared by read-only tests; tests that change state build their own."""
+    with SupaKeeper(_PROTO) as shared_keeper:
+        yield shared_keeper
+
+
+@pytest.fixture(scope="module")
+def empty_keeper():
+    """Keeper with no projects configured, shared by the module."""
+    with SupaKeeper(Config(projects=[], console_output=False)) as shared_keeper:
+        yield shared_keeper
+
+
+@pytest.fixture
+def make_config():
+    """Build a fresh single-project configuration with the given project fields."""
+    def _make(**project_fields) -> Config:
+        return Config(
+            projects=[
+                ProjectConfig(
+                    name="Test Project",
+                    url="https://test.supabase.co",
+                    key="test-key",
+                    **project_fields,
+                ),
+            ],
+            console_output=False,
+        )
+    return _make
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def scenario(request, make_config, mocker):
+    """Keeper for one (table, rest_status) ping scenario, given via indirect parametrization."""
+    table, rest_status = request.param
+    async with SupaKeeper(make_config(table=table)) as scenario_keeper:
+        yield SimpleNamespace(
+            keeper=scenario_keeper,
+            table=table,
+            rest_status=rest_status,
+            requests=mock_rest(mocker, scenario_keeper, rest_status),
+        )
+
+
+def mock_rest(mocker, keeper: SupaKeeper, status_code: int) -> list[httpx.Request]:
+    """Answer the keeper's REST pings with a fixed status; return the requests seen."""
+    requests: list[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=[])
+    
+    # Swap the transport of the keeper's own client, so closing the keeper
+    # still closes the client it created
+    mocker.patch.object(keeper._http, "_transport", httpx.MockTransport(handler))
+    return requests
+
+
+class TestSupaKeeper:
+    """Tests for SupaKeeper class."""
+    
+    def test_fake_client_matches_sdk(self):
+        """Test that the faked auth calls take the same parameters as the SDK's."""
+        # supabase.Client only sets .auth in __init__, so an autospec of it has
+        # no auth surface; compare against a real (offline) auth client instead
+        from supabase import SupabaseAuthClient
+        
+        real = SupabaseAuthClient(url="https://test.supabase.co/auth/v1", auto_refresh_token=False)
+        fake = FakeSupabaseClient().auth
+        
+        for real_method, fake_method in [
+            (real.admin.list_users, fake.admin.list_users),
+            (real.get_session, fake.get_session),
+        ]:
+            assert list(inspect.signature(fake_method).parameters) == list(
+                inspect.signature(real_method).parameters
+            )
+    
+    def test_init(self, keeper):
+        """Test SupaKeeper initialization."""
+        assert keeper.config is _PROTO
+        assert keeper.logger is not None
+    
+    def test_get_status(self, keeper):
+        """Test getting status information."""
+        assert keeper.get_status() == {
+            "total_projects": 1,
+            "enabled_projects": 1,
+            "interval_hours": 48.0,
+            "projects": [
+                {"name": "Test Project", "url": "https://test.supabase.co", "enabled": True},
+            ],
+        }
+    
+    @pytest.mark.parametrize(
+        "scenario, needle",
+        [
+            (("test_table", 200), "test_table"),  # direct REST ping of the table
+            ((None, 503), "auth.users"),  # REST down, falls back to the auth admin API
+        ],
+        indirect=["scenario"],
+        ids=["rest", "auth-fallback"],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ping_project(self, patch_create_client, scenario, needle):
+        """Test pinging a project through REST and through the SDK fallback."""
+        result = await scenario.keeper._ping_project_async(scenario.keeper.config.projects[0])
+        
+        assert result.success is True
+        assert needle in result.message
+        assert scenario.requests[0].url.path == f"/rest/v1/{scenario.table or ''}"
+        assert scenario.requests[0].headers["apikey"] == "test-key"
+        # The Supabase SDK is only needed once the direct REST ping fails
+        assert patch_create_client.called is (scenario.rest_status != 200)
+    
+    def test_ping_all_parallel_preserves_order(self, mocker):
+        """Test concurrent pings return results in configuration order."""
+        config = Config(
+            projects=[
+                ProjectConfig(name=f"P{i}", url=f"https://p{i}.supabase.co", key="key")
+                for i in range(3)
+            ],
+            console_output=False,
+        )
+        
+        with SupaKeeper(config) as keeper:
+            mock_rest(mocker, keeper, 200)
+            results = keeper.ping_all(parallel=True)
+        
+        assert [r.project_name for r in results] == ["P0", "P1", "P2"]
+        assert all(r.success for r in results)
+        assert (keeper.last_success_count, keeper.last_failed_count) == (3, 0)
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ping_project_remembers_working_strategy(self, mocker, patch_create_client):
+        """Test that REST is retried every cycle and the working fallback is tried first."""
+        fake_client = FakeSupabaseClient(list_users_error=_AUTH_DENIED)
+        patch_create_client.return_value = fake_client
+        
+        project = _PROTO.projects[0]
+        async with SupaKeeper(_PROTO) as keeper:
+            requests = mock_rest(mocker, keeper, 503)
+            first = await keeper._ping_project_async(project)
+            second = await keeper._ping_project_async(project)
+        
+        assert "auth session" in first.message
+        assert "auth session" in second.message
+        assert len(requests) == 2
+        assert fake_client.list_users_calls == 1
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ping_project_without_session_fails(self, mocker, patch_create_client, make_config):
+        """Test that a get_session call that sends no request is not a keep-alive."""
+        patch_create_client.return_value = FakeSupabaseClient(
+            list_users_error=_AUTH_DENIED, session=None,
+        )
+        
+        async with SupaKeeper(make_config()) as keeper:
+            keeper.config.retry_attempts = 1
+            mock_rest(mocker, keeper, 503)
+            result = await keeper._ping_project_async(keeper.config.projects[0])
+        
+        assert result.success is False
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ping_project_unexpected_error_not_swallowed(self, mocker, patch_create_client):
+        """Test that non-API errors propagate instead of being retried or falling through."""
+        fake_client = FakeSupabaseClient(list_users_error=_SDK_BUG)
+        patch_create_client.return_value = fake_client
+        
+        config = Config(
+            projects=[
+                ProjectConfig(name="Test", url="https://test.supabase.co", key="key"),
+            ],
+            console_output=False,
+            retry_attempts=3,
+        )
+        
+        async with SupaKeeper(config) as keeper:
+            mock_rest(mocker, keeper, 503)
+            with pytest.raises(RuntimeError, match="bug"):
+                await keeper._ping_project_async(config.projects[0])
+        
+        assert fake_client.list_users_calls == 1
+        assert fake_client.get_session_calls == 0
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_retry_delay_backs_off_exponentially(self, mocker, patch_create_client):
+        """Test that retry delays double after each failed attempt."""
+        patch_create_client.return_value = FakeSupabaseClient(
+            list_users_error=_AUTH_DENIED, session=None,
+        )
+        
+        config = Config(
+            projects=[
+                ProjectConfig(name="Test", url="https://test.supabase.co", key="key"),
+            ],
+            console_output=False,
+            retry_attempts=3,
+            retry_delay=10,
+        )
+        
+        async with SupaKeeper(config) as keeper:
+            mock_rest(mocker, keeper, 503)
+            # Patched on this keeper only, so the test loop's own sleeps are untouched
+            mocker.patch.object(keeper, "_jitter", return_value=1.0)
+            mock_sleep = mocker.patch.object(keeper, "_sleep", new_callable=AsyncMock)
+            result = await keeper._ping_project_async(config.projects[0])
+        
+        assert result.success is False
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [10, 20]
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_client_created_off_event_loop(self, mocker, patch_create_client):
+        """Test that the Supabase client is built in a worker thread, not on the loop."""
+        threads = []
+        
+        def create_client(url, key):
+            threads.append(threading.current_thread())
+            return FakeSupabaseClient()
+        
+        patch_create_client.side_effect = create_client
+        async with SupaKeeper(_PROTO) as keeper:
+            mock_rest(mocker, keeper, 503)
+            await keeper._ping_project_async(_PROTO.projects[0])
+        
+        assert threads and threads[0] is not threading.current_thread()
+    
+    def test_clients_shared_across_keepers(self, patch_create_client):
+        """Test that Supabase clients are reused by later keepers."""
+        project = _PROTO.projects[0]
+        
+        with SupaKeeper(_PROTO) as first_keeper, SupaKeeper(_PROTO) as second_keeper:
+            first = first_keeper._get_client(project)
+            second = second_keeper._get_client(project)
+        
+        assert first is second
+        patch_create_client.assert_called_once_with(project.url, project.key)
+    
+    def test_ping_all_empty_projects(self, empty_keeper):
+        """Test pinging with no projects configured."""
+        assert empty_keeper.ping_all() == []
+
@@ -0,0 +1,48 @@
+"""Tests for the PingResult dataclass."""
+
+from datetime import datetime
+
+import pytest
+
+from supakeeper import keeper as keeper_module
+from supakeeper.keeper import PingResult
+
+
+# Clock reading returned to PingResult while its tests run
+FROZEN_TIME_NS = 1_700_000_000_000_000_000
+
+
+@pytest.fixture(scope="class")
+def frozen_clock(class_mocker):
+    """Stamp every result with FROZEN_TIME_NS instead of reading the clock."""
+    return class_mocker.patch.object(keeper_module, "_clock_ns", return_value=FROZEN_TIME_NS)
+
+
+@pytest.mark.usefixtures("frozen_clock")
+class TestPingResult:
+    """Tests for PingResult dataclass."""
+    
+    @pytest.mark.parametrize(
+        "kwargs, ok",
+        [
+            (dict(project_name="Test", success=True, message="OK", response_time_ms=100.5), True),
+            (dict(project_name="Test", success=False, message="Connection failed"), False),
+        ],
+        ids=["success", "failure"],
+    )
+    def test_ping_result(self, kwargs, ok):
+        """Test creating successful and failed ping results."""
+        result = PingResult(**kwargs)
+        assert result.success is ok
+        assert result.response_time_ms == kwargs.get("response_time_ms")
+        assert result.timestamp_ns == FROZEN_TIME_NS
+    
+    def test_timestamp_from_ns(self):
+        """Test that the timestamp is derived from timestamp_ns."""
+        result = PingResult(
+            project_name="Test",
+            success=True,
+            message="OK",
+            timestamp_ns=FROZEN_TIME_NS + 1_000_000_000,
+        )
+        assert result.timestamp == datetime.fromtimestamp(1_700_000_001)
@@ -0,0 +1,96 @@
+"""Tests for the keep-alive scheduler."""
+
+import asyncio
+import signal
+import threading
+from datetime import timedelta
+
+import pytest
+
+from supakeeper.config import Config
+from supakeeper.keeper import SupaKeeper
+from supakeeper.scheduler import Scheduler
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler, restoring signal handlers afterwards."""
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    with SupaKeeper(Config(projects=[], console_output=False)) as keeper:
+        yield Scheduler(keeper)
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+
+class TestScheduler:
+    """Tests for Scheduler class."""
+    
+    async def test_run_daemon_async_stops_on_signal(self, scheduler, mocker):
+        """Test that a shutdown signal wakes the daemon immediately."""
+        task = asyncio.create_task(scheduler.run_daemon_async(run_immediately=True))
+        while scheduler._async_stop is None:
+            await asyncio.sleep(0)
+        flush = mocker.patch.object(scheduler.logger, "flush")
+        
+        scheduler._signal_handler(signal.SIGTERM, None)
+        # The handler itself must not take logging locks
+        flush.assert_not_called()
+        await asyncio.wait_for(task, timeout=1)
+        
+        assert scheduler._running is False
+        flush.assert_called_once()
+    
+    def test_run_daemon_stops_on_signal(self, scheduler, mocker):
+        """Test that the blocking daemon exits as soon as a signal arrives."""
+        started = threading.Event()
+        
+        async def run_once_async():
+            started.set()
+            return 0, 0
+        
+        mock_run = mocker.patch.object(scheduler.keeper, "run_once_async", side_effect=run_once_async)
+        thread = threading.Thread(target=scheduler.run_daemon)
+        thread.start()
+        assert started.wait(timeout=1)
+        
+        scheduler._signal_handler(signal.SIGINT, None)
+        thread.join(timeout=1)
+        
+        assert not thread.is_alive()
+        mock_run.assert_awaited_once()
+    
+    async def test_job_flushes_log_file(self, scheduler, mocker):
+        """Test that each scheduled job writes its log records to disk."""
+        mocker.patch.object(scheduler.keeper, "run_once_async", return_value=(0, 0))
+        flush = mocker.patch.object(scheduler.logger, "flush")
+        
+        await scheduler._run_job_async()
+        
+        flush.assert_called_once()
+    
+    async def test_run_daemon_async_runs_at_fixed_rate(self, scheduler, mocker):
+        """Test that cycles start one interval apart, however long a job takes."""
+        loop = asyncio.get_running_loop()
+        starts = []
+        
+        async def run_once_async():
+            starts.append(loop.time())
+            if len(starts) == 3:
+                scheduler._signal_handler(signal.SIGTERM, None)
+            await asyncio.sleep(0.03)
+            return 0, 0
+        
+        mocker.patch.object(scheduler.keeper, "run_once_async", side_effect=run_once_async)
+        scheduler._interval = timedelta(seconds=0.05)
+        
+        await asyncio.wait_for(scheduler.run_daemon_async(run_immediately=False), timeout=1)
+        
+        assert starts[2] - starts[0] == pytest.approx(0.1, abs=0.03)
+    
+    def test_reload_interval(self, scheduler):
+        """Test that a changed interval is only used after reload_interval."""
+        scheduler.keeper.config.interval_hours = 12
+        assert scheduler._interval == timedelta(hours=48)
+        
+        scheduler.reload_interval()
+        assert scheduler._interval == timedelta(hours=12)